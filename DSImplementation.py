@@ -3,15 +3,29 @@ Data Structures Implementation
 This code implements arrays, matrices, stacks, queues, linked lists, and trees
 """
 
+from array import array
+
+import numpy as np
+
+
+def _allocate(capacity, typecode=None):
+    # Allocating backing storage: a plain list by default, or a compact
+    # array.array of unboxed numbers (e.g. 'q' for 64-bit ints) when a
+    # typecode is given for homogeneous numeric workloads
+    if typecode is None:
+        return [None] * capacity
+    return array(typecode, [0]) * capacity
+
 
 class MyArray:
     """Custom array implementation with dynamic resizing"""
 
-    def __init__(self, capacity=10):
+    def __init__(self, capacity=10, typecode=None):
         # Initializing array with specified capacity
         self.capacity = capacity
         self.size = 0  # Current number of elements
-        self.data = [None] * capacity  # Internal storage
+        self.typecode = typecode  # None for generic objects
+        self.data = _allocate(capacity, typecode)  # Internal storage
 
     def __getitem__(self, index):
         # Accessing element at index with bounds checking
@@ -28,7 +42,7 @@ class MyArray:
     def append(self, value):
         # Adding element to the end of array, resize if full
         if self.size == self.capacity:
-            self._resize()  # Double capacity when full
+            self._resize()  # Grow capacity when full
         self.data[self.size] = value
         self.size += 1
 
@@ -41,9 +55,8 @@ class MyArray:
         if self.size == self.capacity:
             self._resize()
 
-        # Shifting elements to the right to make space
-        for i in range(self.size, index, -1):
-            self.data[i] = self.data[i - 1]
+        # Shifting elements to the right to make space (single slice move)
+        self.data[index + 1:self.size + 1] = self.data[index:self.size]
 
         # Inserting new element
         self.data[index] = value
@@ -54,21 +67,21 @@ class MyArray:
         if index < 0 or index >= self.size:
             raise IndexError("Index out of bounds")
 
-        # Shifting elements to the left to fill gap
-        for i in range(index, self.size - 1):
-            self.data[i] = self.data[i + 1]
+        deleted_value = self.data[index]
+
+        # Shifting elements to the left to fill gap (single slice move)
+        self.data[index:self.size - 1] = self.data[index + 1:self.size]
 
         self.size -= 1
-        return self.data[self.size]  # Return deleted value
+        return deleted_value
 
     def _resize(self):
-        # Doubling the capacity when array is full
-        self.capacity *= 2
-        new_data = [None] * self.capacity
-        # Copying existing elements to new array
-        for i in range(self.size):
-            new_data[i] = self.data[i]
-        self.data = new_data
+        # Growing capacity by ~1.5x when array is full; growth factor g costs
+        # amortized g / (g - 1) element writes per append (3 here vs 2 for
+        # doubling) but leaves at most a third of the slots unused, not half
+        self.capacity += (self.capacity >> 1) + 8
+        # Copying existing elements and padding with one slice + concat
+        self.data = self.data[:self.size] + _allocate(self.capacity - self.size, self.typecode)
 
     def __len__(self):
         # Returning current number of elements
@@ -79,25 +92,62 @@ class MyArray:
         return str([self.data[i] for i in range(self.size)])
 
 
+# Python types each numpy dtype kind stores without loss or truncation
+# (range overflow on ints still raises and is handled by widening)
+_EXACT_TYPES = {
+    'b': (bool,),
+    'i': (int, bool),
+    'u': (int, bool),
+    'f': (int, float, bool),
+    'c': (int, float, complex, bool),
+}
+
+
 class Matrix:
     """Custom matrix implementation with row/column operations"""
 
-    def __init__(self, rows, cols, fill_value=0):
+    def __init__(self, rows, cols, fill_value=0, dtype=None):
         # Initializing matrix with specified dimensions
         self.rows = rows
         self.cols = cols
-        # Creating 2D list filled with initial value
-        self.data = [[fill_value for _ in range(cols)] for _ in range(rows)]
+        # Numeric fill values get a native buffer (int64, float64, ...);
+        # other values fall back to object storage; pass dtype to override
+        if dtype is None and not isinstance(fill_value, (int, float, complex)):
+            dtype = object
+        # Creating contiguous 2D ndarray filled with initial value
+        self.data = np.full((rows, cols), fill_value, dtype=dtype)
+
+    @classmethod
+    def from_ndarray(cls, values):
+        # Building matrix from a copy of a 2D array, so the caller's array
+        # and the matrix never share memory
+        values = np.array(values)
+        if values.ndim != 2:
+            raise ValueError("Matrix data must be 2-dimensional")
+        matrix = cls.__new__(cls)
+        matrix.rows, matrix.cols = values.shape
+        matrix.data = values
+        return matrix
 
     def __getitem__(self, indices):
         # Accessing element at (row, col)
         row, col = indices
-        return self.data[row][col]
+        return self.data[row, col]
 
     def __setitem__(self, indices, value):
         # Setting element at (row, col)
         row, col = indices
-        self.data[row][col] = value
+        # Only values whose Python type the dtype can't store exactly need
+        # the numpy-level check; the common case is a plain store
+        kind = self.data.dtype.kind
+        if kind != 'O' and type(value) not in _EXACT_TYPES.get(kind, ()):
+            self._widen_for(value)
+        try:
+            self.data[row, col] = value
+        except OverflowError:
+            # Python int outside the range of the current dtype
+            self._widen_for(value)
+            self.data[row, col] = value
 
     def insert_row(self, row_index, row_data=None):
         # Insertting new row at specified position
@@ -111,15 +161,35 @@ class Matrix:
             raise ValueError("Row data length must match number of columns")
 
         # Insertiing row and update dimensions
-        self.data.insert(row_index, row_data)
+        for value in row_data:
+            self._widen_for(value)
+        self.data = np.insert(self.data, row_index, row_data, axis=0)
         self.rows += 1
 
+    def _widen_for(self, value):
+        # Upcasting storage when a scalar would not fit the current dtype
+        # (e.g. a float into an int matrix or a str into a float matrix);
+        # min_scalar_type sizes it by value (300 -> uint16), so range
+        # overflow is caught as well as kind mismatches
+        value_dtype = np.min_scalar_type(value)
+        if not np.can_cast(value_dtype, self.data.dtype, casting='safe'):
+            try:
+                new_dtype = np.result_type(self.data.dtype, value_dtype)
+            except TypeError:
+                new_dtype = None
+            if new_dtype is None or new_dtype.kind not in 'biufc':
+                new_dtype = object  # No common numeric type
+            elif (new_dtype.kind == 'f' and self.data.dtype.kind in 'iu'
+                  and value_dtype.kind in 'iu'):
+                new_dtype = object  # int64 + uint64 -> float64 would round
+            self.data = self.data.astype(new_dtype)
+
     def delete_row(self, row_index):
         # Removing row at specified position
         if row_index < 0 or row_index >= self.rows:
             raise IndexError("Row index out of bounds")
 
-        del self.data[row_index]
+        self.data = np.delete(self.data, row_index, axis=0)
         self.rows -= 1
 
     def insert_col(self, col_index, col_data=None):
@@ -133,9 +203,10 @@ class Matrix:
         elif len(col_data) != self.rows:
             raise ValueError("Column data length must match number of rows")
 
-        # Inserting column in each row
-        for i in range(self.rows):
-            self.data[i].insert(col_index, col_data[i])
+        # Inserting column into all rows in one vectorized call
+        for value in col_data:
+            self._widen_for(value)
+        self.data = np.insert(self.data, col_index, col_data, axis=1)
         self.cols += 1
 
     def delete_col(self, col_index):
@@ -143,11 +214,24 @@ class Matrix:
         if col_index < 0 or col_index >= self.cols:
             raise IndexError("Column index out of bounds")
 
-        # Removing column from each row
-        for i in range(self.rows):
-            del self.data[i][col_index]
+        # Removing column from all rows in one vectorized call
+        self.data = np.delete(self.data, col_index, axis=1)
         self.cols -= 1
 
+    def __matmul__(self, other):
+        # Matrix product via numpy: float64 matrices dispatch to BLAS and
+        # int64 ones use numpy's native integer loop (which wraps on
+        # overflow); only object storage falls back to Python arithmetic
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        if self.cols != other.rows:
+            raise ValueError("Inner matrix dimensions must match")
+        return type(self).from_ndarray(self.data @ other.data)
+
+    def transpose(self):
+        # Returning new matrix with rows and columns swapped
+        return type(self).from_ndarray(self.data.T)
+
     def __str__(self):
         # String representation of matrix
         return '\n'.join([' '.join(map(str, row)) for row in self.data])
@@ -156,11 +240,12 @@ class Matrix:
 class Stack:
     """Array-based stack implementation (LIFO)"""
 
-    def __init__(self, capacity=10):
+    def __init__(self, capacity=10, typecode=None):
         # Initializing stack with specified capacity
         self.capacity = capacity
         self.size = 0  # Current number of elements
-        self.data = [None] * capacity  # Internal storage
+        self.typecode = typecode  # None for generic objects
+        self.data = _allocate(capacity, typecode)  # Internal storage
 
     def push(self, item):
         # Adding element to top of stack
@@ -191,13 +276,10 @@ class Stack:
         return self.size == self.capacity
 
     def _resize(self):
-        # Doubling capacity when stack is full
-        self.capacity *= 2
-        new_data = [None] * self.capacity
-        # Copying existing elements to new array
-        for i in range(self.size):
-            new_data[i] = self.data[i]
-        self.data = new_data
+        # Growing capacity by ~1.5x when stack is full (same policy as MyArray)
+        self.capacity += (self.capacity >> 1) + 8
+        # Copying existing elements and padding with one slice + concat
+        self.data = self.data[:self.size] + _allocate(self.capacity - self.size, self.typecode)
 
     def __len__(self):
         # Returning current number of elements
@@ -211,21 +293,24 @@ class Stack:
 class Queue:
     """Array-based queue implementation (FIFO) using circular buffer"""
 
-    def __init__(self, capacity=10):
-        # Initializing queue with specified capacity
-        self.capacity = capacity
+    def __init__(self, capacity=10, typecode=None):
+        # Initializing queue with capacity rounded up to a power of two, so
+        # wrap-around can use a bit mask instead of modulo
+        self.capacity = 1 << (max(capacity, 1) - 1).bit_length()
+        self.mask = self.capacity - 1
         self.size = 0  # Current number of elements
         self.front = 0  # Index of front element
         self.rear = -1  # Index of rear element
-        self.data = [None] * capacity  # Internal storage
+        self.typecode = typecode  # None for generic objects
+        self.data = _allocate(self.capacity, typecode)  # Internal storage
 
     def enqueue(self, item):
         # Adding element to rear of queue
         if self.is_full():
             self._resize()  # Resize if queue is full
 
-        # Calculating new rear position using modulo for circular buffer
-        self.rear = (self.rear + 1) % self.capacity
+        # Calculating new rear position using mask for circular buffer
+        self.rear = (self.rear + 1) & self.mask
         self.data[self.rear] = item
         self.size += 1
 
@@ -235,8 +320,8 @@ class Queue:
             raise IndexError("Dequeue from empty queue")
 
         item = self.data[self.front]
-        # Moving front pointer using modulo for circular buffer
-        self.front = (self.front + 1) % self.capacity
+        # Moving front pointer using mask for circular buffer
+        self.front = (self.front + 1) & self.mask
         self.size -= 1
         return item
 
@@ -255,16 +340,14 @@ class Queue:
         return self.size == self.capacity
 
     def _resize(self):
-        # Doubling capacity when queue is full
+        # Doubling capacity when queue is full (keeps it a power of two)
         new_capacity = self.capacity * 2
-        new_data = [None] * new_capacity
-
-        # Copyiing elements maintaining order from front to rear
-        for i in range(self.size):
-            new_data[i] = self.data[(self.front + i) % self.capacity]
-
-        self.data = new_data
+        # Rotating the buffer so front lands at index 0, then padding;
+        # two slices + concat keep elements in order from front to rear
+        self.data = (self.data[self.front:] + self.data[:self.front]
+                     + _allocate(new_capacity - self.capacity, self.typecode))
         self.capacity = new_capacity
+        self.mask = new_capacity - 1
         self.front = 0
         self.rear = self.size - 1
 
@@ -276,7 +359,7 @@ class Queue:
         # String representation of queue
         elements = []
         for i in range(self.size):
-            elements.append(self.data[(self.front + i) % self.capacity])
+            elements.append(self.data[(self.front + i) & self.mask])
         return f"Queue({elements})"
 
 
@@ -296,6 +379,7 @@ class LinkedList:
 
     def __init__(self):
         self.head = None  # First node in list
+        self.tail = None  # Last node in list
         self.size = 0  # Number of nodes in list
 
     def insert_at_beginning(self, value):
@@ -303,20 +387,20 @@ class LinkedList:
         new_node = ListNode(value)
         new_node.next = self.head  # New node points to current head
         self.head = new_node  # Update head to new node
+        if self.tail is None:
+            self.tail = new_node  # First node is also the last
         self.size += 1
 
     def insert_at_end(self, value):
         # Insertiing new node at end of list
         new_node = ListNode(value)
         if not self.head:
-            # If list is empty, new node becomes head
-            self.head = new_node
+            # If list is empty, new node becomes head and tail
+            self.head = self.tail = new_node
         else:
-            # Traverse to last node and update its next pointer
-            current = self.head
-            while current.next:
-                current = current.next
-            current.next = new_node
+            # Link after cached tail instead of traversing the list
+            self.tail.next = new_node
+            self.tail = new_node
         self.size += 1
 
     def insert_at_position(self, value, position):
@@ -327,6 +411,9 @@ class LinkedList:
         if position == 0:
             self.insert_at_beginning(value)
             return
+        if position == self.size:
+            self.insert_at_end(value)
+            return
 
         new_node = ListNode(value)
         current = self.head
@@ -346,6 +433,8 @@ class LinkedList:
 
         deleted_value = self.head.value
         self.head = self.head.next  # Move head to next node
+        if self.head is None:
+            self.tail = None  # List is now empty
         self.size -= 1
         return deleted_value
 
@@ -365,6 +454,7 @@ class LinkedList:
 
         deleted_value = current.next.value
         current.next = None  # Remove last node
+        self.tail = current  # Second last node becomes tail
         self.size -= 1
         return deleted_value
 
@@ -384,6 +474,8 @@ class LinkedList:
         deleted_value = current.next.value
         # Skip over node to be deleted
         current.next = current.next.next
+        if current.next is None:
+            self.tail = current  # Deleted node was the tail
         self.size -= 1
         return deleted_value
 
@@ -399,11 +491,13 @@ class LinkedList:
         return -1  # Value not found
 
     def traverse(self):
-        # Return list of all values in order
-        elements = []
+        # Return list of all values in order, preallocated from known size
+        elements = [None] * self.size
+        i = 0
         current = self.head
         while current:
-            elements.append(current.value)
+            elements[i] = current.value
+            i += 1
             current = current.next
         return elements
 
@@ -453,55 +547,62 @@ class RootedTree:
 
     def __init__(self, root_value=0):
         self.root = TreeNode(root_value)
+        # Index from value to node for O(1) lookups; values act as node ids
+        # and must be unique within the tree
+        self._value_to_node = {root_value: self.root}
 
     def insert(self, parent_value, value):
         # Insert new node as child of specified parent
-        parent_node = self._find_node(self.root, parent_value)
+        if value in self._value_to_node:
+            return False  # Values must be unique
+        parent_node = self._value_to_node.get(parent_value)
         if parent_node:
             new_node = TreeNode(value)
             parent_node.add_child(new_node)
+            self._value_to_node[value] = new_node
             return True
         return False  # Parent not found
 
     def delete(self, value):
         # Remove node with specified value (cannot delete root)
-        node_to_delete = self._find_node(self.root, value)
+        node_to_delete = self._value_to_node.get(value)
         if node_to_delete and node_to_delete != self.root:
             node_to_delete.parent.remove_child(node_to_delete)
+            # Dropping the detached subtree from the index in one pass
+            stack = [node_to_delete]
+            while stack:
+                current = stack.pop()
+                del self._value_to_node[current.value]
+                stack.extend(current.children)
             return True
         return False  # Node not found or is root
 
-    def _find_node(self, current_node, value):
-        # Recursively find node with specified value
-        if current_node.value == value:
-            return current_node
-
-        # Search in children
-        for child in current_node.children:
-            found = self._find_node(child, value)
-            if found:
-                return found
-        return None  # Node not found
-
     def traverse_preorder(self, node=None):
-        # Depth-first traversal: root, then children
+        # Depth-first traversal: root, then children (explicit stack, no recursion)
         if node is None:
             node = self.root
 
-        result = [node.value]  # Visit root first
-        for child in node.children:
-            result.extend(self.traverse_preorder(child))  # Then children
+        result = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            result.append(current.value)  # Visit root first
+            stack.extend(reversed(current.children))  # Leftmost child on top
         return result
 
     def traverse_postorder(self, node=None):
-        # Depth-first traversal: children, then root
+        # Depth-first traversal: children, then root (explicit stack, no recursion)
         if node is None:
             node = self.root
 
+        # Root-right-left order reversed is left-right-root (postorder)
         result = []
-        for child in node.children:
-            result.extend(self.traverse_postorder(child))  # Children first
-        result.append(node.value)  # Then root
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            result.append(current.value)
+            stack.extend(current.children)
+        result.reverse()
         return result
 
     def get_height(self, node=None):
@@ -509,11 +610,16 @@ class RootedTree:
         if node is None:
             node = self.root
 
-        if not node.children:
-            return 0  # Leaf node has height 0
-
-        # Height is 1 + max height of children
-        return 1 + max(self.get_height(child) for child in node.children)
+        # Iterative DFS tracking the deepest level reached
+        height = 0
+        stack = [(node, 0)]
+        while stack:
+            current, depth = stack.pop()
+            if depth > height:
+                height = depth
+            for child in current.children:
+                stack.append((child, depth + 1))
+        return height
 
     def print_tree(self):
         # Print tree structure with indentation
@@ -551,6 +657,10 @@ def demonstrate_data_structures():
     mat[1, 2] = 6
     print("\nMatrix:")
     print(mat)
+    print("Transpose:")
+    print(mat.transpose())
+    print("Matrix @ Transpose:")
+    print(mat @ mat.transpose())
 
     print("\n=== Stacks and Queues ===")
     # Stack demonstration
@@ -0,0 +1,145 @@
+"""
+Tests for Data Structures Implementation
+"""
+
+import numpy as np
+import pytest
+
+from DSImplementation import LinkedList, Matrix, Queue, RootedTree
+
+
+def test_matrix_float_reads_back_unchanged():
+    # Default matrix must not truncate floats to ints
+    mat = Matrix(2, 2)
+    mat[0, 0] = 1.5
+    assert mat[0, 0] == 1.5
+
+
+def test_matrix_insert_col_keeps_values():
+    # Inserted data that does not fit the current dtype widens storage
+    mat = Matrix(2, 2, fill_value=0.0)
+    mat.insert_col(0, [2.7, 3.1])
+    mat[1, 1] = "x"
+    assert mat[0, 0] == 2.7 and mat[1, 0] == 3.1
+    assert mat[1, 1] == "x"
+
+
+def test_matrix_default_int_storage_is_native():
+    # Integer fill value keeps a contiguous int64 buffer, not object
+    mat = Matrix(2, 2)
+    assert mat.data.dtype == np.int64
+
+
+def test_matrix_int8_widens_for_out_of_range_value():
+    # 300 does not fit int8; storage widens instead of raising OverflowError
+    mat = Matrix(2, 2, dtype=np.int8)
+    mat[0, 0] = 300
+    assert mat[0, 0] == 300
+
+
+def test_matrix_int64_widens_for_uint64_range_value():
+    # 2**63 is beyond int64; it must be stored exactly, not overflow or round
+    mat = Matrix(2, 2, dtype=int)
+    mat[0, 0] = 2 ** 63
+    assert mat[0, 0] == 2 ** 63
+    mat.insert_row(0, [2 ** 63 + 1, 1])
+    assert mat[0, 0] == 2 ** 63 + 1
+
+
+def test_matrix_matmul_rejects_non_matrix():
+    # Non-Matrix operands defer to Python's TypeError via NotImplemented
+    with pytest.raises(TypeError):
+        Matrix(2, 2) @ 3
+
+
+def test_matrix_matmul_stays_on_native_dtype():
+    # Default int and float products must not fall back to object arithmetic
+    ints = Matrix(2, 2, 1)
+    floats = Matrix(2, 2, 0.5)
+    assert (ints @ ints).data.dtype == np.int64
+    assert (floats @ floats).data.dtype == np.float64
+    assert (ints @ ints)[0, 0] == 2
+
+
+def test_matrix_from_ndarray_copies():
+    # Matrix must not share memory with the caller's array
+    values = np.zeros((2, 2))
+    mat = Matrix.from_ndarray(values)
+    values[0, 0] = 5.0
+    assert mat[0, 0] == 0.0
+
+
+def _assert_tail(ll):
+    # Tail must be the last node reached from head
+    expected = ll.traverse()
+    assert (ll.tail.value if ll.tail else None) == (expected[-1] if expected else None)
+    assert ll.tail is None or ll.tail.next is None
+
+
+def test_linked_list_tail_after_each_delete_path():
+    ll = LinkedList()
+    for value in (1, 2, 3, 4, 5):
+        ll.insert_at_end(value)
+    _assert_tail(ll)
+
+    assert ll.delete_at_end() == 5
+    _assert_tail(ll)
+    assert ll.delete_at_position(3) == 4  # Deleting the last node by position
+    _assert_tail(ll)
+    assert ll.delete_at_position(1) == 2  # Deleting a middle node
+    _assert_tail(ll)
+    assert ll.delete_at_beginning() == 1
+    _assert_tail(ll)
+    assert ll.delete_at_end() == 3  # Single node: list becomes empty
+    assert ll.head is None and ll.tail is None
+
+    ll.insert_at_beginning(7)  # First node is also the tail
+    ll.insert_at_position(8, 1)  # Position == size appends
+    assert ll.traverse() == [7, 8]
+    _assert_tail(ll)
+
+
+def test_queue_wraps_across_resize():
+    queue = Queue(4)
+    for value in range(4):
+        queue.enqueue(value)
+    assert queue.dequeue() == 0
+    assert queue.dequeue() == 1
+    # Rear wraps to the start of the buffer before the queue fills up
+    queue.enqueue(4)
+    queue.enqueue(5)
+    assert queue.front == 2 and queue.rear == 1
+    queue.enqueue(6)  # Full with front != 0: resize must unwrap in order
+    assert queue.capacity == 8
+    assert str(queue) == "Queue([2, 3, 4, 5, 6])"
+    assert [queue.dequeue() for _ in range(5)] == [2, 3, 4, 5, 6]
+    assert queue.is_empty()
+
+
+def test_queue_capacity_rounds_up_to_power_of_two():
+    assert Queue(10).capacity == 16
+    assert Queue(0).capacity == 1
+
+
+def test_rooted_tree_rejects_duplicate_value():
+    tree = RootedTree(0)
+    assert tree.insert(0, 9)
+    assert not tree.insert(0, 9)
+    assert not tree.insert(9, 0)  # Root value is taken too
+    assert tree.traverse_preorder() == [0, 9]
+
+
+def test_rooted_tree_reinsert_after_subtree_delete():
+    tree = RootedTree(1)
+    tree.insert(1, 2)
+    tree.insert(2, 3)
+    tree.insert(3, 4)
+    assert tree.delete(2)
+    # Whole subtree is gone, so its values can neither parent nor be looked up
+    assert not tree.insert(3, 5)
+    assert not tree.delete(4)
+    # ...and they are free to be inserted again
+    assert tree.insert(1, 3)
+    assert tree.insert(3, 4)
+    assert tree.traverse_preorder() == [1, 3, 4]
+    assert tree.get_height() == 2
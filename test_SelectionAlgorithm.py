@@ -0,0 +1,63 @@
+"""
+Tests for Selection Algorithms
+"""
+
+import itertools
+import random
+
+import pytest
+
+import SelectionAlgorithm
+from SelectionAlgorithm import SelectionAlgorithms, _median5
+
+SELECTORS = [SelectionAlgorithms.randomized_select, SelectionAlgorithms.deterministic_select]
+
+
+def _inputs():
+    # Random, duplicate-heavy and short-group inputs (sizes not multiples of 5)
+    rng = random.Random(532)
+    cases = []
+    for size in (1, 2, 3, 4, 5, 6, 7, 11, 24, 26, 101, 500):
+        cases.append([rng.randint(1, size * 10) for _ in range(size)])
+        cases.append([rng.choice([1, 2, 3]) for _ in range(size)])
+        cases.append([7] * size)
+        cases.append(list(range(size, 0, -1)))
+    return cases
+
+
+@pytest.mark.parametrize("select", SELECTORS)
+def test_select_matches_sorted(select):
+    for arr in _inputs():
+        for k in {0, len(arr) // 2, len(arr) - 1}:
+            assert select(arr, k) == sorted(arr)[k]
+
+
+@pytest.mark.parametrize("select", SELECTORS)
+def test_select_does_not_modify_input(select):
+    arr = [5, 3, 9, 1, 7, 3, 8]
+    select(arr, 3)
+    assert arr == [5, 3, 9, 1, 7, 3, 8]
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+@pytest.mark.parametrize("select", SELECTORS)
+def test_select_rejects_out_of_range_k(monkeypatch, select, use_numpy):
+    monkeypatch.setattr(SelectionAlgorithm, "USE_NUMPY_PARTITION", use_numpy)
+    with pytest.raises(IndexError):
+        select([], 0)
+    with pytest.raises(IndexError):
+        select([1, 2], 2)
+
+
+@pytest.mark.parametrize("select", SELECTORS)
+def test_numpy_path_matches_python_path(monkeypatch, select):
+    monkeypatch.setattr(SelectionAlgorithm, "USE_NUMPY_PARTITION", True)
+    assert select([2 ** 70, 1, 5], 1) == 5
+    arr = [random.randint(1, 100) for _ in range(99)]
+    assert select(arr, 40) == sorted(arr)[40]
+
+
+def test_median5_exhaustive():
+    # Every ordering of 5 values drawn from 0..4, duplicates included
+    for values in itertools.product(range(5), repeat=5):
+        assert _median5(*values) == sorted(values)[2]